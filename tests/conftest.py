@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from validator import BadDeedValidator  # noqa: E402
+
+COUNTIES_FILE = os.path.join(REPO_ROOT, 'counties.json')
+
+SAMPLE_DEED = """*** RECORDING REQ ***
+Doc: DEED-TRUST-0042
+County: S. Clara | State: CA
+Date Signed: 2024-01-15
+Date Recorded: 2024-01-10
+Grantor: T.E.S.L.A. Holdings LLC
+Grantee: John & Sarah Connor
+Amount: $1,250,000.00 (One Million Two Hundred Thousand Dollars)
+APN: 992-001-XA
+Status: PRELIMINARY
+*** END ***"""
+
+
+def make_deed(county='Santa Clara', signed='2024-01-10', recorded='2024-01-15',
+              amount='$1,250,000.00', written='1.25 Million Dollars'):
+    return (
+        f'Doc: DEED-TEST\n'
+        f'County: {county} | State: CA\n'
+        f'Date Signed: {signed}\n'
+        f'Date Recorded: {recorded}\n'
+        f'Grantor: Seller LLC\n'
+        f'Grantee: Buyer LLC\n'
+        f'Amount: {amount} ({written})\n'
+        f'APN: 123-456-XY\n'
+        f'Status: PRELIMINARY\n'
+    )
+
+
+@pytest.fixture(scope='session')
+def validator():
+    return BadDeedValidator(COUNTIES_FILE)
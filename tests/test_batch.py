@@ -0,0 +1,53 @@
+import validator as validator_module
+
+from conftest import SAMPLE_DEED, make_deed
+
+DEEDS = [
+    SAMPLE_DEED,
+    make_deed(),
+    make_deed(county='Santa Cruz', signed='2024-02-15', recorded='2024-02-10'),
+    make_deed(county='Sant Mateo', amount='$500,000.00', written='500 Thousand Dollars'),
+    make_deed(county='S.M.', amount='$9,250,000.00'),
+    make_deed(county='SantaClara', recorded='2024-13-01'),
+    make_deed(county='Zzzz'),
+    'County: \nnothing useful here',
+    '',
+] * 5
+
+
+def sequential_reports(validator, texts):
+    return [validator.process_and_report(text) for text in texts]
+
+
+def test_process_batch_matches_sequential(validator):
+    assert validator.process_batch(DEEDS, workers=2, chunksize=4) == (
+        sequential_reports(validator, DEEDS)
+    )
+
+
+def test_process_batch_empty(validator):
+    assert validator.process_batch([], workers=2) == []
+
+
+def test_process_batch_threaded_matches_sequential(validator):
+    assert validator.process_batch_threaded(DEEDS, workers=3) == (
+        sequential_reports(validator, DEEDS)
+    )
+
+
+def test_process_batch_threaded_accepts_iterators(validator):
+    assert validator.process_batch_threaded(iter(DEEDS), workers=1) == (
+        sequential_reports(validator, DEEDS)
+    )
+
+
+def test_process_deeds_matches_process_deed(validator):
+    batched = [validator._report(deed) for deed in validator.process_deeds(DEEDS)]
+    assert batched == sequential_reports(validator, DEEDS)
+
+
+def test_process_deeds_with_difflib_fallback(validator, monkeypatch):
+    monkeypatch.setattr(validator_module, 'process', None)
+    monkeypatch.setattr(validator_module, 'fuzz', None)
+    batched = [validator._report(deed) for deed in validator.process_deeds(DEEDS)]
+    assert batched == sequential_reports(validator, DEEDS)
@@ -0,0 +1,89 @@
+import pytest
+
+import validator as validator_module
+from validator import CountyLookupError
+
+QUERIES = [
+    'Santa Clara', '  santa cruz ', 'S.C.', 'SM', 'SantaClara', 'S. Clara',
+    'Sant Clra', 'Sant Mateo', 'Santa Kruz', 'Zzzz', 'San', '', None,
+]
+
+
+def outcome(matcher, county_raw):
+    try:
+        return matcher.match_county(county_raw)
+    except CountyLookupError as e:
+        return CountyLookupError, str(e)
+
+
+def batch_outcomes(matcher, county_raws):
+    return [
+        (type(result), str(result)) if isinstance(result, CountyLookupError) else result
+        for result in matcher.match_counties(county_raws)
+    ]
+
+
+@pytest.fixture
+def no_rapidfuzz(monkeypatch):
+    monkeypatch.setattr(validator_module, 'process', None)
+    monkeypatch.setattr(validator_module, 'fuzz', None)
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    monkeypatch.setattr(validator_module, 'numpy', None)
+
+
+def test_known_names_and_abbreviations(validator):
+    matcher = validator.matcher
+    assert matcher.match_county('Santa Clara') == ('Santa Clara', 1.0)
+    assert matcher.match_county('S.C.') == ('Santa Clara', 0.95)
+
+
+def test_lookup_errors(validator):
+    with pytest.raises(CountyLookupError, match='County name is empty'):
+        validator.matcher.match_county('')
+    with pytest.raises(CountyLookupError, match='No match for ZZZZ'):
+        validator.matcher.match_county('Zzzz')
+    with pytest.raises(CountyLookupError, match='County not found'):
+        validator.matcher.get_tax_rate('Nowhere')
+
+
+def test_get_tax_rate_is_case_insensitive(validator):
+    assert validator.matcher.get_tax_rate('SAN mateo') == 0.011
+
+
+def test_match_counties_matches_match_county(validator):
+    matcher = validator.matcher
+    assert batch_outcomes(matcher, QUERIES) == [outcome(matcher, q) for q in QUERIES]
+
+
+def test_match_counties_without_numpy(validator, no_numpy):
+    matcher = validator.matcher
+    assert batch_outcomes(matcher, QUERIES) == [outcome(matcher, q) for q in QUERIES]
+
+
+def test_match_counties_with_difflib_fallback(validator, no_rapidfuzz):
+    matcher = validator.matcher
+    assert batch_outcomes(matcher, QUERIES) == [outcome(matcher, q) for q in QUERIES]
+
+
+def test_difflib_fallback_matches_rapidfuzz(validator, monkeypatch):
+    pytest.importorskip('rapidfuzz')
+    matcher = validator.matcher
+    expected = [outcome(matcher, q) for q in QUERIES]
+    monkeypatch.setattr(validator_module, 'process', None)
+    monkeypatch.setattr(validator_module, 'fuzz', None)
+    for county_raw, want in zip(QUERIES, expected):
+        got = outcome(matcher, county_raw)
+        assert got[0] == want[0], county_raw
+        if got[0] is CountyLookupError:
+            assert got[1] == want[1]
+        else:
+            assert got[1] == pytest.approx(want[1])
+
+
+def test_spacing_and_punctuation_variants(validator):
+    matcher = validator.matcher
+    assert matcher.match_county('SantaClara') == ('Santa Clara', 0.95)
+    assert matcher.match_county('Santa.Cruz') == ('Santa Cruz', 0.95)
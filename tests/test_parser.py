@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from conftest import SAMPLE_DEED
+
+
+def test_parses_all_fields(validator):
+    deed = validator.parser.parse(SAMPLE_DEED)
+    assert deed.doc_id == 'DEED-TRUST-0042'
+    assert deed.county_raw == 'S. Clara'
+    assert deed.state == 'CA'
+    assert deed.date_signed == datetime(2024, 1, 15)
+    assert deed.date_recorded == datetime(2024, 1, 10)
+    assert deed.grantor == 'T.E.S.L.A. Holdings LLC'
+    assert deed.grantee == 'John & Sarah Connor'
+    assert deed.amount_numeric == 1_250_000.0
+    assert deed.amount_written == 'One Million Two Hundred Thousand Dollars'
+    assert deed.apn == '992-001-XA'
+    assert deed.status == 'PRELIMINARY'
+
+
+def test_single_line_blob_keeps_fields_after_greedy_values(validator):
+    raw = ('Doc: D-1 County: Santa Clara State: CA Grantor: A Grantee: B '
+           'Amount: $9,250,000.00 (1.25 Million) APN: 1 Status: OK')
+    deed = validator.parser.parse(raw)
+    assert deed.grantee.startswith('B')
+    assert deed.amount_numeric == 9_250_000.0
+    assert deed.amount_written == '1.25 Million'
+    assert deed.apn == '1'
+    assert deed.status == 'OK'
+
+
+def test_single_line_amount_mismatch_is_rejected(validator):
+    raw = ('Doc: D-1 County: Santa Clara | State: CA Grantor: A Grantee: B '
+           'Amount: $9,250,000.00 (1.25 Million) APN: 1 Status: OK')
+    report = validator.process_and_report(raw)
+    assert report['status'] == 'REJECTED'
+    assert any('Amount mismatch' in e for e in report['validation_summary']['errors'])
+
+
+def test_pipe_less_county_line_keeps_state(validator):
+    deed = validator.parser.parse('County: Santa Clara State: CA')
+    assert deed.state == 'CA'
+
+
+def test_doc_label_without_value_does_not_hide_county(validator):
+    deed = validator.parser.parse('Doc\nCounty: X')
+    assert deed.county_raw == 'X'
+
+
+def test_invalid_date_is_none(validator):
+    deed = validator.parser.parse('Date Signed: 2024-13-40')
+    assert deed.date_signed is None
@@ -0,0 +1,130 @@
+import pickle
+from datetime import datetime
+
+from validator import DeedData
+
+from conftest import SAMPLE_DEED, make_deed
+
+
+def test_date_check_uses_current_datetimes_on_hand_built_deed(validator):
+    deed = DeedData()
+    deed.date_signed = datetime(2024, 1, 15)
+    deed.date_recorded = datetime(2024, 1, 10)
+    validator.validator.validate(deed)
+    assert any('Date logic violation' in e for e in deed.errors)
+
+
+def test_date_check_compares_time_of_day(validator):
+    deed = DeedData()
+    deed.date_signed = datetime(2024, 1, 15, 17, 0)
+    deed.date_recorded = datetime(2024, 1, 15, 9, 0)
+    validator.validator.validate(deed)
+    assert any('Date logic violation' in e for e in deed.errors)
+
+
+def test_date_check_sees_edited_dates(validator):
+    deed = validator.parser.parse('Date Signed: 2024-01-10\nDate Recorded: 2024-01-15')
+    deed.date_recorded = datetime(2024, 1, 5)
+    validator.validator.validate(deed)
+    assert any('Date logic violation' in e for e in deed.errors)
+
+
+def test_recorded_before_signed_is_rejected(validator):
+    report = validator.process_and_report(make_deed(signed='2024-01-15', recorded='2024-01-10'))
+    assert report['status'] == 'REJECTED'
+    assert report['validation_summary']['errors'] == [
+        'Date logic violation: Recorded 2024-01-10 is before Signed 2024-01-15'
+    ]
+
+
+def test_recorded_after_signed_is_approved(validator):
+    report = validator.process_and_report(make_deed(signed='2024-01-10', recorded='2024-01-15'))
+    assert report['status'] == 'APPROVED'
+    assert report['validation_summary']['errors'] == []
+
+
+def test_same_day_recording_is_approved(validator):
+    report = validator.process_and_report(make_deed(signed='2024-01-15', recorded='2024-01-15'))
+    assert report['status'] == 'APPROVED'
+
+
+def test_date_error_does_not_hide_amount_and_county_results(validator):
+    report = validator.process_and_report(make_deed(
+        county='S. Clara', signed='2024-01-15', recorded='2024-01-10',
+        amount='$9,250,000.00', written='1.25 Million Dollars',
+    ))
+    errors = report['validation_summary']['errors']
+    assert report['status'] == 'REJECTED'
+    assert len(errors) == 2
+    assert errors[0].startswith('Date logic violation')
+    assert errors[1].startswith('Amount mismatch')
+    assert report['deed']['county_normalized'] == 'Santa Clara'
+    assert report['deed']['tax_rate'] == 0.012
+
+
+def test_sample_deed_reports_every_check(validator):
+    report = validator.process_and_report(SAMPLE_DEED)
+    assert report['status'] == 'REJECTED'
+    assert report['validation_summary']['error_count'] == 1
+    assert report['deed']['county_normalized'] == 'Santa Clara'
+    assert 'Could not parse: One Million Two Hundred Thousand Dollars' in (
+        report['validation_summary']['warnings']
+    )
+
+
+def test_parse_written_amount(validator):
+    parse = validator.validator._parse_written_amount
+    assert parse('1.25 Million Dollars') == 1_250_000.0
+    assert parse('1 Million 250 Thousand Dollars') == 1_250_000.0
+    assert parse('500 Thousand Dollars') == 500_000.0
+    assert parse('One Million Dollars') is None
+    assert parse('Dollars') is None
+
+
+def test_parse_written_amount_keeps_first_figure_per_unit(validator):
+    parse = validator.validator._parse_written_amount
+    assert parse('2 Million 3 Million') == 2_000_000.0
+    assert parse('5 Thousand 3 Thousand') == 5_000.0
+    assert parse('1.25 Million / 1.25 Million Dollars') == 1_250_000.0
+
+
+def test_repeated_written_figure_reconciles(validator):
+    report = validator.process_and_report(
+        make_deed(written='1.25 Million / 1.25 Million Dollars')
+    )
+    assert report['status'] == 'APPROVED'
+
+
+def test_deed_data_round_trips_through_pickle(validator):
+    deed = validator.process_deed(SAMPLE_DEED)
+    restored = pickle.loads(pickle.dumps(deed))
+    assert not hasattr(restored, '__dict__')
+    assert restored.to_dict() == deed.to_dict()
+def test_process_and_validate_only_matches_report_status(validator):
+    for raw in (SAMPLE_DEED, make_deed(), make_deed(amount='$9,250,000.00'), ''):
+        approved = validator.process_and_report(raw)['status'] == 'APPROVED'
+        assert validator.process_and_validate_only(raw) is approved
+
+
+def test_to_dict_includes_empty_fields_by_default(validator):
+    data = validator.process_deed('County: Santa Clara').to_dict()
+    assert data['doc_id'] is None
+    assert data['county_normalized'] == 'Santa Clara'
+
+
+def test_to_dict_can_drop_empty_fields(validator):
+    deed = validator.process_deed('County: Santa Clara')
+    full = deed.to_dict()
+    sparse = deed.to_dict(include_empty=False)
+    assert sparse == {key: value for key, value in full.items() if value is not None}
+    assert list(sparse) == [key for key, value in full.items() if value is not None]
+    assert 'doc_id' not in sparse
+    assert sparse['errors'] == [] and sparse['warnings'] == []
+
+
+def test_sparse_to_dict_of_full_deed_matches_full_dict(validator):
+    deed = validator.process_deed(SAMPLE_DEED)
+    full = deed.to_dict()
+    assert deed.to_dict(include_empty=False) == {
+        key: value for key, value in full.items() if value is not None
+    }
@@ -14,11 +14,60 @@ Engineering approach:
 """
 
 import json
+import os
 import re
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional, Pattern, Union
 import difflib
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional C extension; fall back to difflib
+    fuzz = process = None
+
+try:
+    import numpy  # required by rapidfuzz.process.cdist for batched scoring
+except ImportError:
+    numpy = None
+
+try:
+    import orjson
+except ImportError:  # optional C extension; fall back to json
+    orjson = None
+
+
+# Field patterns are compiled once at import time; parse() runs them per deed
+_DOC_ID_RE = re.compile(r'Doc[^:]*:\s*(\S+)', re.IGNORECASE)
+_COUNTY_RE = re.compile(r'County[^:]*:\s*([^|\n]+)', re.IGNORECASE)
+_STATE_RE = re.compile(r'State[^:]*:\s*(\w{2})', re.IGNORECASE)
+_DATE_SIGNED_RE = re.compile(r'Date Signed[^\d]*(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_DATE_RECORDED_RE = re.compile(r'Date Recorded[^\d]*(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_GRANTOR_RE = re.compile(r'Grantor[^:]*:\s*([^\n]+)', re.IGNORECASE)
+_GRANTEE_RE = re.compile(r'Grantee[^:]*:\s*([^\n]+)', re.IGNORECASE)
+_APN_RE = re.compile(r'APN[^:]*:\s*(\S+)', re.IGNORECASE)
+_STATUS_RE = re.compile(r'Status[^:]*:\s*(\w+)', re.IGNORECASE)
+_AMOUNT_RE = re.compile(r'Amount[^:]*:\s*\$([\d,.]+)')
+_AMOUNT_WRITTEN_RE = re.compile(r'\(([^)]*(?:Million|Thousand)[^)]*)\)')
+# Group 1 holds a millions figure, group 2 a thousands figure
+_WRITTEN_RE = re.compile(r'(\d+(?:\.\d+)?)\s*Million|(\d+(?:\.\d+)?)\s*Thousand')
+
+# Fuzzy county matches scoring below this ratio are rejected
+_MIN_FUZZY_RATIO = 0.6
+
+# Drops dots and spaces in one pass before abbreviation lookup ('S. C.' -> 'SC')
+_STRIP_TABLE = str.maketrans('', '', '. ')
+
+
+def _load_counties(counties_file: str) -> List[Dict]:
+    if orjson is not None:
+        with open(counties_file, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(counties_file) as f:
+        return json.load(f)
+
 
 class ValidationError(Exception):
     """Base exception for all validation errors"""
@@ -43,6 +92,13 @@ class CountyLookupError(ValidationError):
 class DeedData:
     """Structured representation of extracted deed data"""
     
+    __slots__ = (
+        'doc_id', 'county_raw', 'county_normalized', 'state',
+        'date_signed', 'date_recorded', 'grantor', 'grantee',
+        'amount_numeric', 'amount_written', 'apn', 'status',
+        'tax_rate', 'errors', 'warnings',
+    )
+    
     def __init__(self):
         self.doc_id: Optional[str] = None
         self.county_raw: Optional[str] = None
@@ -60,7 +116,40 @@ class DeedData:
         self.errors: List[str] = []
         self.warnings: List[str] = []
     
-    def to_dict(self) -> Dict:
+    def to_dict(self, include_empty: bool = True) -> Dict:
+        """JSON-compatible dict; include_empty=False omits fields that are None"""
+        if not include_empty:
+            # Built field by field so omitted fields cost no dict insert
+            data = {}
+            if self.doc_id is not None:
+                data['doc_id'] = self.doc_id
+            if self.county_raw is not None:
+                data['county_raw'] = self.county_raw
+            if self.county_normalized is not None:
+                data['county_normalized'] = self.county_normalized
+            if self.state is not None:
+                data['state'] = self.state
+            if self.date_signed is not None:
+                data['date_signed'] = self.date_signed.isoformat()
+            if self.date_recorded is not None:
+                data['date_recorded'] = self.date_recorded.isoformat()
+            if self.grantor is not None:
+                data['grantor'] = self.grantor
+            if self.grantee is not None:
+                data['grantee'] = self.grantee
+            if self.amount_numeric is not None:
+                data['amount_numeric'] = self.amount_numeric
+            if self.amount_written is not None:
+                data['amount_written'] = self.amount_written
+            if self.apn is not None:
+                data['apn'] = self.apn
+            if self.status is not None:
+                data['status'] = self.status
+            if self.tax_rate is not None:
+                data['tax_rate'] = self.tax_rate
+            data['errors'] = self.errors
+            data['warnings'] = self.warnings
+            return data
         return {
             'doc_id': self.doc_id,
             'county_raw': self.county_raw,
@@ -83,46 +172,46 @@ class DeedData:
 class DeedParser:
     """Parses OCR text using regex patterns only (no LLM)"""
     
-    def __init__(self, counties_file='counties.json'):
-        with open(counties_file, 'r') as f:
-            self.counties_db = json.load(f)
+    def __init__(self, counties_file='counties.json', counties_db: Optional[List[Dict]] = None):
+        if counties_db is None:
+            counties_db = _load_counties(counties_file)
+        self.counties_db = counties_db
     
     def parse(self, raw_text: str) -> DeedData:
         deed = DeedData()
-        deed.doc_id = self._extract_field(raw_text, r'Doc[^:]*:\s*(\S+)')
-        deed.county_raw = self._extract_field(raw_text, r'County[^:]*:\s*([^|\n]+)')
-        deed.state = self._extract_field(raw_text, r'State[^:]*:\s*(\w{2})')
-        deed.date_signed = self._parse_date(raw_text, r'Date Signed')
-        deed.date_recorded = self._parse_date(raw_text, r'Date Recorded')
-        deed.grantor = self._extract_field(raw_text, r'Grantor[^:]*:\s*([^\n]+)')
-        deed.grantee = self._extract_field(raw_text, r'Grantee[^:]*:\s*([^\n]+)')
-        deed.apn = self._extract_field(raw_text, r'APN[^:]*:\s*(\S+)')
-        deed.status = self._extract_field(raw_text, r'Status[^:]*:\s*(\w+)')
+        deed.doc_id = self._extract_field(raw_text, _DOC_ID_RE)
+        deed.county_raw = self._extract_field(raw_text, _COUNTY_RE)
+        deed.state = self._extract_field(raw_text, _STATE_RE)
+        deed.date_signed = self._parse_date(raw_text, _DATE_SIGNED_RE)
+        deed.date_recorded = self._parse_date(raw_text, _DATE_RECORDED_RE)
+        deed.grantor = self._extract_field(raw_text, _GRANTOR_RE)
+        deed.grantee = self._extract_field(raw_text, _GRANTEE_RE)
+        deed.apn = self._extract_field(raw_text, _APN_RE)
+        deed.status = self._extract_field(raw_text, _STATUS_RE)
         
         # Extract amounts
-        amount_match = re.search(r'Amount[^:]*:\s*\$([\d,.]+)', raw_text)
+        amount_match = _AMOUNT_RE.search(raw_text)
         if amount_match:
             try:
                 deed.amount_numeric = float(amount_match.group(1).replace(',', ''))
             except ValueError:
                 pass
         
-        written_match = re.search(r'\(([^)]*(?:Million|Thousand)[^)]*)\)', raw_text)
+        written_match = _AMOUNT_WRITTEN_RE.search(raw_text)
         if written_match:
             deed.amount_written = written_match.group(1).strip()
         
         return deed
     
-    def _extract_field(self, text: str, pattern: str) -> Optional[str]:
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _extract_field(self, text: str, pattern: Pattern[str]) -> Optional[str]:
+        match = pattern.search(text)
         return match.group(1).strip() if match else None
     
-    def _parse_date(self, text: str, pattern: str) -> Optional[datetime]:
-        regex = rf'{pattern}[^\d]*(\d{{4}})-(\d{{2}})-(\d{{2}})'
-        match = re.search(regex, text, re.IGNORECASE)
+    def _parse_date(self, text: str, pattern: Pattern[str]) -> Optional[datetime]:
+        match = pattern.search(text)
         if match:
             try:
-                return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+                return datetime.fromisoformat(match.group(1))
             except ValueError:
                 return None
         return None
@@ -133,41 +222,121 @@ class CountyMatcher:
     
     def __init__(self, counties_db):
         self.counties_db = counties_db
+        # County fields as parallel arrays (indexed by position), computed once
+        self.names: List[str] = []
+        self.upper_names: List[str] = []
+        self.abbrevs: List[str] = []
+        self.tax_rates = array('d')
+        for info in counties_db:
+            self.names.append(info['name'])
+            self.upper_names.append(info['name'].upper())
+            self.abbrevs.append(''.join(w[0] for w in info['name'].split()).upper())
+            self.tax_rates.append(info['tax_rate'])
+        # Uppercased name -> index, and dot/space-stripped name or abbreviation
+        # -> index. The first county wins on duplicates (Santa Clara/Santa Cruz
+        # -> SC), and full names take precedence over abbreviations.
+        self._name_index: Dict[str, int] = {}
+        self._variant_index: Dict[str, int] = {}
+        for i, upper_name in enumerate(self.upper_names):
+            self._name_index.setdefault(upper_name, i)
+            self._variant_index.setdefault(upper_name.translate(_STRIP_TABLE), i)
+        for i, abbrev in enumerate(self.abbrevs):
+            self._variant_index.setdefault(abbrev, i)
     
     def match_county(self, county_raw: str) -> Tuple[str, float]:
         if not county_raw:
             raise CountyLookupError('County name is empty')
         
         county_raw = county_raw.strip().upper()
-        best_match, best_ratio = None, 0
+        return self._match_known(county_raw) or self._match_fuzzy(county_raw)
+    
+    def match_counties(self, county_raws: List[str], workers: int = -1
+                       ) -> List[Union[Tuple[str, float], CountyLookupError]]:
+        """Batch match_county scoring every fuzzy query in one rapidfuzz call
+
+        Each entry is what match_county would return, or the CountyLookupError
+        it would raise. `workers` is passed to rapidfuzz.process.cdist (-1 uses
+        all cores).
+        """
+        results: List[Union[Tuple[str, float], CountyLookupError, None]] = []
+        fuzzy_positions, fuzzy_queries = [], []
+        batched = process is not None and numpy is not None and bool(self.upper_names)
+        for county_raw in county_raws:
+            try:
+                if not county_raw:
+                    raise CountyLookupError('County name is empty')
+                county_raw = county_raw.strip().upper()
+                match = self._match_known(county_raw)
+                if match is None and batched:
+                    fuzzy_positions.append(len(results))
+                    fuzzy_queries.append(county_raw)
+                elif match is None:
+                    match = self._match_fuzzy(county_raw)
+            except CountyLookupError as e:
+                match = e
+            results.append(match)
         
-        for county_info in self.counties_db:
-            county_name = county_info['name'].upper()
-            
-            # Exact match
-            if county_raw == county_name:
-                return county_info['name'], 1.0
-            
-            # Abbreviation match (S. Clara -> Santa Clara)
-            abbrev = ''.join([w[0] for w in county_info['name'].split()]).upper()
-            if county_raw.replace('.', '').replace(' ', '') == abbrev:
-                return county_info['name'], 0.95
-            
-            # Fuzzy match
-            ratio = difflib.SequenceMatcher(None, county_raw, county_name).ratio()
+        if fuzzy_queries:
+            scores = process.cdist(
+                fuzzy_queries, self.upper_names, scorer=fuzz.ratio,
+                score_cutoff=_MIN_FUZZY_RATIO * 100, dtype=numpy.float64, workers=workers
+            )
+            for position, county_raw, row in zip(fuzzy_positions, fuzzy_queries, scores):
+                index = int(row.argmax())
+                # cdist reports scores below score_cutoff as 0
+                if row[index] == 0:
+                    results[position] = CountyLookupError(f'No match for {county_raw}')
+                else:
+                    results[position] = self.names[index], float(row[index]) / 100
+        return results
+    
+    def _match_known(self, county_raw: str) -> Optional[Tuple[str, float]]:
+        """Exact and variant lookups on an uppercased county name"""
+        # Exact match
+        index = self._name_index.get(county_raw)
+        if index is not None:
+            return self.names[index], 1.0
+        
+        # Abbreviation or spacing variant (S. Clara -> Santa Clara, SantaClara)
+        index = self._variant_index.get(county_raw.translate(_STRIP_TABLE))
+        if index is not None:
+            return self.names[index], 0.95
+        return None
+    
+    def _match_fuzzy(self, county_raw: str) -> Tuple[str, float]:
+        if process is not None:
+            result = process.extractOne(
+                county_raw, self.upper_names, scorer=fuzz.ratio,
+                score_cutoff=_MIN_FUZZY_RATIO * 100
+            )
+            if result is None:
+                raise CountyLookupError(f'No match for {county_raw}')
+            _, score, index = result
+            return self.names[index], score / 100
+        
+        best_match, best_ratio = None, 0
+        matcher = difflib.SequenceMatcher(None, county_raw)
+        for name, upper_name in zip(self.names, self.upper_names):
+            matcher.set_seq2(upper_name)
+            # real_quick_ratio() and quick_ratio() are cheap upper bounds on
+            # ratio(); skip candidates that cannot reach the cutoff or the best
+            cutoff = max(best_ratio, _MIN_FUZZY_RATIO)
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
+            ratio = matcher.ratio()
             if ratio > best_ratio:
-                best_ratio, best_match = ratio, county_info['name']
+                best_ratio, best_match = ratio, name
         
-        if best_ratio < 0.6:
+        if best_ratio < _MIN_FUZZY_RATIO:
             raise CountyLookupError(f'No match for {county_raw}')
         
         return best_match, best_ratio
     
     def get_tax_rate(self, county_name: str) -> float:
-        for county_info in self.counties_db:
-            if county_info['name'].upper() == county_name.upper():
-                return county_info['tax_rate']
-        raise CountyLookupError(f'County not found: {county_name}')
+        try:
+            return self.tax_rates[self._name_index[county_name.upper()]]
+        except KeyError:
+            raise CountyLookupError(f'County not found: {county_name}') from None
 
 
 class DeedValidator:
@@ -176,11 +345,18 @@ class DeedValidator:
     def __init__(self, counties_matcher: CountyMatcher):
         self.matcher = counties_matcher
     
-    def validate(self, deed: DeedData) -> DeedData:
+    def validate(self, deed: DeedData,
+                 county_match: Union[Tuple[str, float], CountyLookupError, None] = None
+                 ) -> DeedData:
+        """Run all checks; county_match is a precomputed match_counties entry"""
+        # Each check runs on its own so one failure doesn't skip the rest
+        for check in (self._validate_date_logic, self._validate_amount_reconciliation):
+            try:
+                check(deed)
+            except ValidationError as e:
+                deed.errors.append(str(e))
         try:
-            self._validate_date_logic(deed)
-            self._validate_amount_reconciliation(deed)
-            self._enrich_county(deed)
+            self._enrich_county(deed, county_match)
         except ValidationError as e:
             deed.errors.append(str(e))
         return deed
@@ -188,7 +364,7 @@ class DeedValidator:
     def _validate_date_logic(self, deed: DeedData) -> None:
         """CRITICAL: Recorded date cannot be before signed date"""
         if deed.date_signed and deed.date_recorded:
-            if deed.date_recorded > deed.date_signed:
+            if deed.date_recorded < deed.date_signed:
                 raise DateLogicError(
                     f'Date logic violation: Recorded {deed.date_recorded.date()} '
                     f'is before Signed {deed.date_signed.date()}'
@@ -211,10 +387,16 @@ class DeedValidator:
                 f'(diff: ${discrepancy:,.2f})'
             )
     
-    def _enrich_county(self, deed: DeedData) -> None:
+    def _enrich_county(self, deed: DeedData,
+                       county_match: Union[Tuple[str, float], CountyLookupError, None] = None
+                       ) -> None:
         try:
             if deed.county_raw:
-                normalized, confidence = self.matcher.match_county(deed.county_raw)
+                if county_match is None:
+                    county_match = self.matcher.match_county(deed.county_raw)
+                elif isinstance(county_match, CountyLookupError):
+                    raise county_match
+                normalized, confidence = county_match
                 deed.county_normalized = normalized
                 deed.tax_rate = self.matcher.get_tax_rate(normalized)
                 if confidence < 0.9:
@@ -223,15 +405,18 @@ class DeedValidator:
             deed.warnings.append(str(e))
     
     def _parse_written_amount(self, written: str) -> Optional[float]:
-        amount = 0.0
-        if 'Million' in written:
-            m = re.search(r'(\d+(?:\.\d+)?)\s*Million', written)
-            if m:
-                amount += float(m.group(1)) * 1_000_000
-        if 'Thousand' in written:
-            t = re.search(r'(\d+(?:\.\d+)?)\s*Thousand', written)
-            if t:
-                amount += float(t.group(1)) * 1_000
+        if 'Million' not in written and 'Thousand' not in written:
+            return None
+        # First figure per unit only, so a repeated figure isn't counted twice
+        figures = [None, None]
+        for match in _WRITTEN_RE.finditer(written):
+            unit = match.lastindex - 1
+            if figures[unit] is None:
+                figures[unit] = float(match.group(match.lastindex))
+                if None not in figures:
+                    break
+        millions, thousands = figures
+        amount = (millions or 0.0) * 1_000_000 + (thousands or 0.0) * 1_000
         return amount if amount > 0 else None
 
 
@@ -239,9 +424,9 @@ class BadDeedValidator:
     """Main orchestrator for deed validation workflow"""
     
     def __init__(self, counties_file='counties.json'):
-        with open(counties_file) as f:
-            counties_db = json.load(f)
-        self.parser = DeedParser(counties_file)
+        self.counties_file = counties_file
+        counties_db = _load_counties(counties_file)
+        self.parser = DeedParser(counties_db=counties_db)
         self.matcher = CountyMatcher(counties_db)
         self.validator = DeedValidator(self.matcher)
     
@@ -249,8 +434,26 @@ class BadDeedValidator:
         deed = self.parser.parse(raw_ocr_text)
         return self.validator.validate(deed)
     
+    def process_deeds(self, raw_ocr_texts: List[str], workers: int = -1) -> List[DeedData]:
+        """Batch process_deed; county names are fuzzy-scored in a single call"""
+        deeds = [self.parser.parse(raw_ocr_text) for raw_ocr_text in raw_ocr_texts]
+        county_matches = self.matcher.match_counties(
+            [deed.county_raw for deed in deeds], workers=workers
+        )
+        return [
+            self.validator.validate(deed, county_match)
+            for deed, county_match in zip(deeds, county_matches)
+        ]
+    
+    def process_and_validate_only(self, raw_ocr_text: str) -> bool:
+        """True if the deed passes every check; skips building the report"""
+        return not self.process_deed(raw_ocr_text).errors
+    
     def process_and_report(self, raw_ocr_text: str) -> Dict:
-        deed = self.process_deed(raw_ocr_text)
+        return self._report(self.process_deed(raw_ocr_text))
+    
+    @staticmethod
+    def _report(deed: DeedData) -> Dict:
         return {
             'status': 'APPROVED' if not deed.errors else 'REJECTED',
             'deed': deed.to_dict(),
@@ -261,3 +464,59 @@ class BadDeedValidator:
                 'warning_count': len(deed.warnings)
             }
         }
+    
+    def process_batch(self, raw_ocr_texts: List[str], workers: Optional[int] = None,
+                      chunksize: int = 64) -> List[Dict]:
+        """Report on many deeds in parallel, one validator per worker process
+
+        Deeds are sent in chunks of `chunksize`; each worker scores a chunk's
+        county names together via process_deeds.
+        """
+        chunks = [
+            raw_ocr_texts[i:i + chunksize] for i in range(0, len(raw_ocr_texts), chunksize)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(self.counties_file,),
+        ) as executor:
+            return [
+                report
+                for reports in executor.map(_report_chunk_in_worker, chunks)
+                for report in reports
+            ]
+    
+    def process_batch_threaded(self, raw_ocr_texts: Iterable[str],
+                               workers: Optional[int] = None) -> List[Dict]:
+        """Report on many deeds with a thread pool sharing this validator
+
+        Cheaper to start than process_batch and suited to embedding in a web
+        service, but threads only overlap while the GIL is released (e.g. inside
+        rapidfuzz), so the speedup is smaller than with worker processes.
+        """
+        workers = workers or os.cpu_count()
+        # Cap in-flight deeds so streamed input is not queued all at once
+        slots = threading.BoundedSemaphore(workers)
+        futures = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for raw_ocr_text in raw_ocr_texts:
+                slots.acquire()
+                future = executor.submit(self.process_and_report, raw_ocr_text)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+        return [future.result() for future in futures]
+
+
+# Per-process validator for process_batch, built once by the pool initializer
+_worker_validator: Optional[BadDeedValidator] = None
+
+
+def _init_worker(counties_file: str) -> None:
+    global _worker_validator
+    _worker_validator = BadDeedValidator(counties_file)
+
+
+def _report_chunk_in_worker(raw_ocr_texts: List[str]) -> List[Dict]:
+    # Processes already use every core, so keep rapidfuzz single-threaded here
+    deeds = _worker_validator.process_deeds(raw_ocr_texts, workers=1)
+    return [BadDeedValidator._report(deed) for deed in deeds]